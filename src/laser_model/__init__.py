@@ -1,6 +1,19 @@
 __version__ = "1.0.0"
 
 from .core import compute
-from .model import Model
 
-__all__ = ["Model"]
+__all__ = ["Model", "SparseReport", "compute"]
+
+
+def __getattr__(name):
+    # Import on first use so that, e.g., the `laser` CLI can dispatch without paying for NumPy, pandas, and matplotlib.
+    if name == "Model":
+        from .model import Model
+
+        return Model
+    if name == "SparseReport":
+        from .reports import SparseReport
+
+        return SparseReport
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,5 @@
 """
-Entrypoint module, in case you use `python -mlaser_measles`.
+Entrypoint module, in case you use `python -mlaser_model`.
 
 
 Why does this file exist, and why __main__? For more info, read:
@@ -9,7 +9,7 @@ Why does this file exist, and why __main__? For more info, read:
 - https://docs.python.org/3/using/cmdline.html#cmdoption-m
 """
 
-from laser_measles.generic.model import run
+from laser_model.cli import laser
 
 if __name__ == "__main__":
-    run()
+    laser(prog_name="laser")
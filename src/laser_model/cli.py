@@ -13,16 +13,57 @@ Why does this file exist, and why not put this in __main__?
     there"s no ``laser_model.__main__`` in ``sys.modules``.
 
   Also see (1) from https://click.palletsprojects.com/en/stable/setuptools/
+
+Subcommands are only imported when they are invoked. Importing the model pulls in laser_core, NumPy, pandas, and
+matplotlib, which would otherwise make ``laser --help`` and every dispatch take seconds rather than milliseconds.
+Keep this module's imports limited to click.
 """
 
+from importlib import import_module
+
 import click
 
-from .core import compute
+from laser_model import __version__
+
+# name -> (module:attribute of the click command, short help for `laser --help`)
+COMMANDS = {
+    "run": ("laser_model.generic.model:run", "Run the model simulation."),
+    "sweep": ("laser_model.generic.sweep:sweep", "Run the model over a grid of parameters and seeds."),
+    "serve": ("laser_model.generic.server:serve", "Run a persistent JSON-RPC worker reusing the loaded model."),
+    "bench": ("laser_model.generic.bench:bench", "Run the built-in performance benchmarks."),
+    "profile": ("laser_model.generic.profiling:profile", "Run the model under cProfile and print the hot spots."),
+    "inspect-scenario": ("laser_model.generic.model:inspect_scenario", "Summarize the scenario."),
+}
+
+
+class LazyGroup(click.Group):
+    """
+    A click group which imports each subcommand only when it is invoked.
+    """
+
+    def list_commands(self, ctx):
+        return list(COMMANDS)
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in COMMANDS:
+            return None
+        module, attribute = COMMANDS[cmd_name][0].split(":")
+
+        return getattr(import_module(module), attribute)
+
+    def format_commands(self, ctx, formatter):
+        # Use the short help from COMMANDS rather than importing every command for its docstring.
+        with formatter.section("Commands"):
+            formatter.write_dl([(name, short_help) for name, (_, short_help) in COMMANDS.items()])
+
+        return
 
 
-@click.command()
-@click.argument("names", nargs=-1)
-def run(names):
-    click.echo(compute(names))
+@click.group(cls=LazyGroup)
+@click.version_option(version=__version__)
+def laser():
+    """
+    Command line tools for the LASER model.
+    """
 
     return
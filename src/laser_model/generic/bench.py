@@ -0,0 +1,111 @@
+"""
+This module provides the `laser bench` command which runs the built-in performance benchmarks and prints throughput.
+
+Each benchmark is a function taking the command line options and returning a callable to time, the amount of work
+that callable does, and the unit of that work. The callable is timed `--repeat` times and the best time is reported.
+
+Benchmarks:
+
+    model
+
+        Runs the generic model, setup excluded, and reports ticks per second.
+
+    sparse-report
+
+        Writes, tick by tick, a `SparseReport` with about 1% non-zero cells and reads it back, reporting cells per second.
+
+    downsample
+
+        Sums the patches into 16 regions and downsamples the totals for a 1024 pixel wide plot, reporting cells per second.
+"""
+
+import io
+import time
+from contextlib import redirect_stderr
+from contextlib import redirect_stdout
+
+import click
+
+
+def bench_model(nticks: int, npatches: int):
+    from laser_model import Model
+
+    from .model import get_components
+    from .model import get_scenario
+    from .params import get_parameters
+
+    model = Model(get_scenario(), get_parameters({"nticks": nticks, "seed": 20241107}))
+    model.components = get_components()
+
+    def run():
+        model.reset()
+        model.run()
+
+    return run, nticks, "ticks"
+
+
+def bench_sparse_report(nticks: int, npatches: int):
+    import numpy as np
+
+    from laser_model import SparseReport
+
+    prng = np.random.default_rng(20241107)
+    nevents = max(npatches // 100, 1)
+    events = prng.integers(0, npatches, size=(nticks, nevents))
+
+    def run():
+        report = SparseReport(nticks, npatches)
+        for tick in range(nticks):
+            report.row(tick)[events[tick]] += 1
+        for start in range(0, nticks, 365):
+            report[start : start + 365]
+
+    return run, 2 * nticks * npatches, "cells"
+
+
+def bench_downsample(nticks: int, npatches: int):
+    import numpy as np
+
+    from laser_model.plotting import RegionTotals
+    from laser_model.plotting import downsample
+
+    prng = np.random.default_rng(20241107)
+    data = prng.poisson(0.05, size=(nticks, npatches))
+    regions = np.arange(npatches) % 16
+
+    def run():
+        downsample(RegionTotals(data, regions), 2048)
+
+    return run, nticks * npatches, "cells"
+
+
+BENCHMARKS = {
+    "model": bench_model,
+    "sparse-report": bench_sparse_report,
+    "downsample": bench_downsample,
+}
+
+
+@click.command()
+@click.argument("names", nargs=-1, type=click.Choice(list(BENCHMARKS)))
+@click.option("--nticks", default=3650, help="Number of ticks for each benchmark")
+@click.option("--npatches", default=1000, help="Number of patches for benchmarks which take it")
+@click.option("--repeat", default=3, help="Number of times to run each benchmark, the best time is reported")
+def bench(names, nticks, npatches, repeat):
+    """
+    Run the named built-in benchmarks (default all) and print their throughput.
+    """
+
+    width = max(map(len, BENCHMARKS))
+    for name in names or BENCHMARKS:
+        sink = io.StringIO()  # the model reports progress as it runs, keep it out of the results
+        with redirect_stdout(sink), redirect_stderr(sink):
+            run, work, unit = BENCHMARKS[name](nticks, npatches)
+            best = float("inf")
+            for _ in range(repeat):
+                tstart = time.perf_counter()
+                run()
+                best = min(best, time.perf_counter() - tstart)
+        click.echo(f"{name:{width}}: {work / best:15,.0f} {unit}/s ({best * 1000:,.1f} ms)")
+
+    return
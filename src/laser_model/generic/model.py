@@ -9,6 +9,14 @@ Classes:
 
 Functions:
 
+    get_scenario()
+
+        Returns the scenario DataFrame for the generic model.
+
+    get_components()
+
+        Returns the list of component classes for the generic model.
+
     run(\*\*kwargs)
 
         Runs the model simulation with the specified parameters.
@@ -24,15 +32,23 @@ Functions:
             - params (str): JSON file with parameters. Default is None.
             - param (tuple): Additional parameter overrides in the form of (param:value or param=value). Default is an empty tuple.
 
+    inspect_scenario()
+
+        Prints a summary of the scenario: the number of patches and, for each column, its type and range.
+
 Usage:
 
     To run the simulation from the command line (365 ticks, 20241107 seed, show visualizations):
 
-        ``laser``
+        ``laser run``
 
     To run the simulation with custom parameters, e.g., 5 years, 314159265 seed, output to PDF:
 
-        ``laser --nticks 1825 --seed 314159265 --pdf``
+        ``laser run --nticks 1825 --seed 314159265 --pdf``
+
+    To summarize the scenario without running the model:
+
+        ``laser inspect-scenario``
 """
 
 import click
@@ -43,6 +59,30 @@ from laser_model import Model
 from .params import get_parameters
 
 
+def get_scenario() -> pd.DataFrame:
+    """
+    Load the scenario (one row per patch) for the generic model.
+
+    Returns:
+
+        pd.DataFrame: The scenario data.
+    """
+
+    return pd.DataFrame({"node": [0, 1, 2]})
+
+
+def get_components() -> list:
+    """
+    Return the list of component classes, in update order, for the generic model.
+
+    Returns:
+
+        list: The component classes to assign to `Model.components`.
+    """
+
+    return []
+
+
 @click.command()
 @click.option("--nticks", default=365, help="Number of ticks to run the simulation")
 @click.option("--seed", default=20241107, help="Random seed")
@@ -75,11 +115,11 @@ def run(**kwargs):
         None
     """
 
-    scenario = pd.DataFrame({"node": [0, 1, 2]})
+    scenario = get_scenario()
     parameters = get_parameters(kwargs)
     model = Model(scenario, parameters)
 
-    model.components = []
+    model.components = get_components()
 
     model.run()
 
@@ -89,6 +129,27 @@ def run(**kwargs):
     return
 
 
+@click.command("inspect-scenario")
+def inspect_scenario():
+    """
+    Print a summary of the scenario: the number of patches and, for each column, its type and range.
+    """
+
+    scenario = get_scenario()
+    click.echo(f"{len(scenario):,} patches, {len(scenario.columns)} columns")
+
+    width = max(map(len, map(str, scenario.columns)), default=0)
+    for column in scenario.columns:
+        series = scenario[column]
+        if pd.api.types.is_numeric_dtype(series):
+            summary = f"min {series.min():,} max {series.max():,} sum {series.sum():,}"
+        else:
+            summary = f"{series.nunique():,} unique values"
+        click.echo(f"{column!s:{width}}  {series.dtype!s:10}  {summary}")
+
+    return
+
+
 if __name__ == "__main__":
     ctx = click.Context(run)
     ctx.invoke(run, nticks=365, seed=20241107, verbose=True, viz=True, pdf=False)
@@ -44,6 +44,7 @@ def get_parameters(kwargs) -> PropertySet:
         {
             "nticks": 365,
             "verbose": False,
+            "check_interval": 7,  # ticks between evaluations of the run controls (see Model.run)
         }
     )
 
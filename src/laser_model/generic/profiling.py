@@ -0,0 +1,51 @@
+"""
+This module provides the `laser profile` command which runs the generic model under cProfile and prints the functions
+where the most time was spent.
+
+Usage:
+
+    Profile a 5 year run, sorted by time spent in each function itself, and keep the full profile for snakeviz et al.:
+
+        ``laser profile --nticks 1825 --sort tottime --output model.prof``
+"""
+
+import cProfile
+import pstats
+
+import click
+
+
+@click.command()
+@click.option("--nticks", default=365, help="Number of ticks to run the simulation")
+@click.option("--seed", default=20241107, help="Random seed")
+@click.option("--params", default=None, help="JSON file with parameters")
+@click.option("--param", "-p", multiple=True, help="Additional parameter overrides (param:value or param=value)")
+@click.option("--sort", default="cumulative", type=click.Choice(["cumulative", "tottime", "ncalls"]), help="Sort order of the report")
+@click.option("--limit", default=25, help="Number of functions to report")
+@click.option("--output", default=None, help="Output file for the raw profile (pstats format)")
+def profile(sort, limit, output, **kwargs):
+    """
+    Run the model (setup and simulation, no visualization) under cProfile and print the top functions.
+    """
+
+    from laser_model import Model
+
+    from .model import get_components
+    from .model import get_scenario
+    from .params import get_parameters
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    scenario = get_scenario()
+    parameters = get_parameters(kwargs)
+    model = Model(scenario, parameters)
+    model.components = get_components()
+    model.run()
+    profiler.disable()
+
+    if output is not None:
+        profiler.dump_stats(output)
+        click.echo(f"Profile saved to '{output}'.")
+    pstats.Stats(profiler).strip_dirs().sort_stats(sort).print_stats(limit)
+
+    return
@@ -0,0 +1,272 @@
+r"""
+This module provides a long-lived, headless worker for the generic model.
+
+Starting the interpreter, importing laser_core, pandas, and matplotlib, and loading the scenario dominate the cost of
+short runs. The worker pays those costs once and then services any number of run requests, resetting the model in
+place between runs rather than rebuilding it.
+
+Requests and responses are newline delimited JSON-RPC 2.0 messages, read from stdin and written to stdout by default,
+or exchanged over a TCP socket on the loopback interface with ``--port``. Anything the model prints while running is
+sent to stderr so it cannot corrupt the response stream.
+
+Methods:
+
+    run(\*\*overrides)
+
+        Run the model and return a summary of the run. `overrides` use the same keys as the `get_parameters` kwargs,
+        e.g., ``{"seed": 42, "param": ["nticks=730"]}``. `param` entries are applied after those given on the command line.
+
+    ping()
+
+        Returns "pong", useful to check that the worker is up.
+
+    shutdown()
+
+        Stops the worker after responding.
+
+Usage:
+
+    ``echo '{"jsonrpc": "2.0", "id": 1, "method": "run", "params": {"seed": 42}}' | laser serve``
+"""
+
+import inspect
+import json
+import socketserver
+import sys
+from contextlib import redirect_stdout
+
+import click
+
+from laser_model import Model
+
+from .model import get_components
+from .model import get_scenario
+from .params import get_parameters
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+
+class InvalidParamsError(ValueError):
+    """
+    Raised by `Worker.run` for overrides of the wrong type, reported as a JSON-RPC "invalid params" error.
+    """
+
+
+class Worker:
+    """
+    A worker holding a single, reusable model instance.
+
+    Args:
+
+        kwargs (dict): Base keyword arguments for `get_parameters`, applied to every run before the request's overrides.
+
+    Notes:
+
+        The scenario is loaded and the model and its components are created once, in the constructor. Each run request
+        resets the model in place (see `Model.reset`), including after a run which stopped early. If a request changes
+        `nticks`, the components are re-created since their per-tick arrays are sized by it.
+    """
+
+    def __init__(self, kwargs: dict) -> None:
+        self.kwargs = kwargs
+        self.stopped = False
+        self.scenario = get_scenario()
+        self.model = Model(self.scenario, get_parameters(kwargs))
+        self.model.components = get_components()
+
+        return
+
+    def run(self, **overrides) -> dict:
+        """
+        Run the model once with the given parameter overrides.
+
+        Args:
+
+            overrides: Keyword arguments in the `get_parameters` format, e.g., "seed", "nticks", or "param".
+
+        Returns:
+
+            dict: The seed and number of ticks used, the number of ticks actually run and why the run stopped early, if
+            it did, the wall clock time of the run in seconds, the total time spent in each phase in microseconds, and
+            the `results(model)` of any component providing them.
+
+        Raises:
+
+            InvalidParamsError: If "param" is not a list of strings, "seed" is not an integer, or "nticks" is not a positive integer.
+        """
+
+        param = overrides.get("param", [])
+        if not isinstance(param, list) or not all(isinstance(kvp, str) for kvp in param):
+            raise InvalidParamsError("Expected 'param' to be a list of 'param=value' strings.")
+        for key in ("nticks", "seed"):
+            if key in overrides and (not isinstance(overrides[key], int) or isinstance(overrides[key], bool)):
+                raise InvalidParamsError(f"Expected '{key}' to be an integer.")
+        if overrides.get("nticks", 1) < 1:
+            raise InvalidParamsError("Expected 'nticks' to be at least 1.")
+
+        kwargs = dict(self.kwargs)
+        for key, value in overrides.items():
+            if key == "param":
+                kwargs["param"] = (*kwargs.get("param", ()), *value)
+            else:
+                kwargs[key] = value
+
+        parameters = get_parameters(kwargs)
+        model = self.model
+        # re-create the components if their per-tick arrays were sized for a different run length
+        if parameters.nticks != model.params.nticks:
+            model.params = parameters
+            model.components = model.components
+        model.reset(parameters)
+
+        model.run()
+
+        names = [type(phase).__name__ for phase in model.phases]
+        totals = [sum(timing[index + 1] for timing in model.metrics) for index in range(len(names))]
+        results = {}
+        for instance in model.instances[1:]:
+            if hasattr(instance, "results"):
+                results.update(instance.results(model))
+
+        return {
+            "seed": parameters.seed,
+            "nticks": parameters.nticks,
+            "ticks_run": model.ticks_run,
+            "stop_reason": model.stop_reason,
+            "elapsed": (model.tfinish - model.tstart).total_seconds(),
+            "timing": dict(zip(names, totals)),
+            "results": results,
+        }
+
+    def ping(self) -> str:
+        return "pong"
+
+    def shutdown(self) -> None:
+        self.stopped = True
+
+        return
+
+    def handle(self, line) -> dict:
+        """
+        Handle a single JSON-RPC request.
+
+        Args:
+
+            line (bytes or str): The JSON encoded request.
+
+        Returns:
+
+            dict: The JSON-RPC response, or None for notifications (requests without an "id"), even if they fail.
+        """
+
+        try:
+            request = json.loads(line.decode("utf-8") if isinstance(line, bytes) else line)
+        except (UnicodeDecodeError, json.JSONDecodeError) as ex:
+            return _error(None, PARSE_ERROR, str(ex))
+
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return _error(None, INVALID_REQUEST, "Expected an object with a 'method'.")
+
+        response = self._dispatch(request)
+
+        return response if "id" in request else None
+
+    def _dispatch(self, request: dict) -> dict:
+        request_id = request.get("id")
+        method = {"run": self.run, "ping": self.ping, "shutdown": self.shutdown}.get(request["method"])
+        if method is None:
+            return _error(request_id, METHOD_NOT_FOUND, f"Unknown method `{request['method']}`.")
+
+        params = request.get("params", {})
+        if not isinstance(params, dict):
+            return _error(request_id, INVALID_PARAMS, "Expected 'params' to be an object.")
+        try:
+            inspect.signature(method).bind(**params)
+        except TypeError as ex:
+            return _error(request_id, INVALID_PARAMS, str(ex))
+
+        try:
+            result = method(**params)
+        except InvalidParamsError as ex:
+            return _error(request_id, INVALID_PARAMS, str(ex))
+        except Exception as ex:
+            return _error(request_id, SERVER_ERROR, f"{type(ex).__name__}: {ex}")
+
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def serve(self, rfile, wfile) -> None:
+        """
+        Read requests from `rfile`, one per line, and write responses to `wfile` until EOF or a shutdown request.
+
+        Args:
+
+            rfile: A binary file-like object to read requests from.
+            wfile: A binary file-like object to write responses to.
+
+        Returns:
+
+            None
+        """
+
+        for line in rfile:
+            if not line.strip():
+                continue
+            with redirect_stdout(sys.stderr):
+                response = self.handle(line)
+            if response is not None:
+                wfile.write(json.dumps(response, default=_to_json).encode("utf-8") + b"\n")
+                wfile.flush()
+            if self.stopped:
+                break
+
+        return
+
+
+def _error(request_id, code: int, message: str) -> dict:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def _to_json(obj):
+    # NumPy scalars and arrays
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@click.command()
+@click.option("--nticks", default=365, help="Default number of ticks to run the simulation")
+@click.option("--seed", default=20241107, help="Default random seed")
+@click.option("--verbose", is_flag=True, help="Print verbose output (to stderr)")
+@click.option("--params", default=None, help="JSON file with parameters")
+@click.option("--param", "-p", multiple=True, help="Additional parameter overrides (param:value or param=value)")
+@click.option("--port", default=None, type=int, help="Serve on this TCP port on 127.0.0.1 rather than stdin/stdout")
+def serve(port, **kwargs):
+    """
+    Run a persistent worker which services JSON-RPC run requests, one per line, reusing the loaded model between runs.
+    """
+
+    with redirect_stdout(sys.stderr):
+        worker = Worker(kwargs)
+
+    if port is None:
+        worker.serve(sys.stdin.buffer, sys.stdout.buffer)
+    else:
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                worker.serve(self.rfile, self.wfile)
+
+        with socketserver.TCPServer(("127.0.0.1", port), Handler) as server:
+            click.echo(f"Listening on 127.0.0.1:{server.server_address[1]}…", err=True)
+            while not worker.stopped:
+                server.handle_request()
+
+    return
+
+
+if __name__ == "__main__":
+    serve()
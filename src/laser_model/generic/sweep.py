@@ -0,0 +1,94 @@
+"""
+This module provides the `laser sweep` command which runs the generic model over a grid of parameter values and seeds.
+
+All runs share one `Worker` (see `server.py`), so the scenario is loaded and the model built once, and each run only
+resets the model. One row per run is written as CSV: the seed, the value of each swept parameter, the number of ticks
+run, why the run stopped early (if it did), and the wall clock time of the run.
+
+Usage:
+
+    Run 10 seeds for each of three values of `nticks`, writing the results to `sweep.csv`:
+
+        ``laser sweep --seeds 10 --grid nticks=365,730,1095 --output sweep.csv``
+"""
+
+import csv
+import itertools
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import click
+
+from .params import get_parameters
+from .server import Worker
+
+
+@click.command()
+@click.option("--nticks", default=365, help="Number of ticks to run the simulation")
+@click.option("--seed", default=20241107, help="First random seed, subsequent runs use seed+1, seed+2, …")
+@click.option("--seeds", default=1, help="Number of seeds to run for each combination of parameter values")
+@click.option("--params", default=None, help="JSON file with parameters")
+@click.option("--param", "-p", multiple=True, help="Additional parameter overrides (param:value or param=value)")
+@click.option("--grid", "-g", multiple=True, help="Parameter values to sweep (param=value1,value2,…)")
+@click.option("--output", default=None, help="Output CSV file for results (default stdout)")
+def sweep(seed, seeds, grid, output, **kwargs):
+    """
+    Run the model for each combination of the --grid parameter values and each of --seeds seeds.
+    """
+
+    axes = {}
+    for spec in grid:
+        key, _, values = spec.replace(":", "=", 1).partition("=")
+        if not values:
+            raise click.BadParameter(f"expected param=value1,value2,… not `{spec}`", param_hint="--grid")
+        if key == "seed":
+            raise click.BadParameter("use --seed and --seeds to vary the seed", param_hint="--grid")
+        if key in axes:
+            raise click.BadParameter(f"`{key}` is given more than once", param_hint="--grid")
+        axes[key] = values.split(",")
+
+    kwargs["seed"] = seed
+    with redirect_stdout(sys.stderr):
+        known = get_parameters(kwargs)
+    unknown = [key for key in axes if key not in known]
+    if unknown:
+        raise click.BadParameter(f"unknown parameter(s) {', '.join(f'`{key}`' for key in unknown)}", param_hint="--grid")
+    for key, values in axes.items():
+        try:
+            axes[key] = [type(known[key])(value) for value in values]
+        except ValueError as ex:
+            raise click.BadParameter(f"bad value for `{key}`: {ex}", param_hint="--grid") from ex
+
+    with redirect_stdout(sys.stderr):
+        worker = Worker(kwargs)
+
+    rows = []
+    for values in itertools.product(*axes.values()):
+        param = [f"{key}={value}" for key, value in zip(axes, values)]
+        for run_seed in range(seed, seed + seeds):
+            with redirect_stdout(sys.stderr):
+                result = worker.run(seed=run_seed, param=param)
+            rows.append(
+                {
+                    "seed": run_seed,
+                    **dict(zip(axes, values)),
+                    "ticks_run": result["ticks_run"],
+                    "stop_reason": result["stop_reason"] or "",
+                    "elapsed": result["elapsed"],
+                }
+            )
+
+    fieldnames = ["seed", *axes, "ticks_run", "stop_reason", "elapsed"]
+    if output is None:
+        writer = csv.DictWriter(sys.stdout, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        with Path(output).open("w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+        click.echo(f"Results for {len(rows):,} runs saved to '{output}'.")
+
+    return
@@ -18,6 +18,7 @@ Imports:
     - matplotlib.backends.backend_pdf: For PDF generation.
     - matplotlib.figure: For figure handling.
     - tqdm: For progress bar visualization.
+    - laser_model.plotting: For downsampled plotting of per-tick outputs.
     - laser_measles.measles_births: For handling measles birth data.
     - laser_measles.utils: For utility functions.
 
@@ -32,17 +33,20 @@ Model Class:
         components(self, components: list) -> None:
             Sets the list of components in the model and initializes instances and phases.
 
+        reset(self, parameters: PropertySet = None) -> None:
+            Resets the model, and any components supporting it, in place for another run.
+
         __call__(self, model, tick: int) -> None:
             Updates the model for a given tick.
 
         run(self) -> None:
-            Runs the model for the specified number of ticks.
+            Runs the model for the specified number of ticks, or until a run control stops it early.
 
         visualize(self, pdf: bool = True) -> None:
             Generates visualizations of the model's results, either displaying them or saving to a PDF.
 
         plot(self, fig: Figure = None):
-            Generates plots for the scenario patches and populations, distribution of day of birth, and update phase times.
+            Generates an example plot and a plot of the update phase times for each tick.
 """
 
 from datetime import datetime
@@ -57,6 +61,8 @@ from matplotlib.backends.backend_pdf import PdfPages
 from matplotlib.figure import Figure
 from tqdm import tqdm
 
+from .plotting import plot_timeseries
+
 
 class Model:
     """
@@ -104,6 +110,9 @@ class Model:
 
         click.echo(f"Initializing the {name} model with {len(scenario)} patches…")
 
+        # run controls, callables (model, tick) -> stop reason or None, see run()
+        self.controls = []
+
         # TODO: Initialize the model here
 
         return
@@ -147,6 +156,34 @@ class Model:
 
         return
 
+    def reset(self, parameters: PropertySet = None) -> None:
+        """
+        Reset the model in place so it can be run again without being rebuilt.
+
+        The scenario and anything derived from it in `__init__` are kept. The random number generator is reseeded
+        and each component instance with a `reset(model)` method is asked to restore its initial state. Components
+        holding large arrays should refill them in place (e.g., `array[:] = 0`) rather than reallocating them.
+
+        Args:
+
+            parameters (PropertySet, optional): New parameters for the next run, e.g., with a different seed. If None, the current parameters are reused.
+
+        Returns:
+
+            None
+        """
+
+        if parameters is not None:
+            self.params = parameters
+
+        self.prng = seed_prng(self.params.seed if self.params.seed is not None else datetime.now(tz=None).microsecond)  # noqa: DTZ005
+
+        for instance in self.instances[1:]:
+            if hasattr(instance, "reset"):
+                instance.reset(self)
+
+        return
+
     def __call__(self, model, tick: int) -> None:
         """
         Updates the model for the next tick.
@@ -170,14 +207,28 @@ class Model:
         This method initializes the start time, iterates over the number of ticks specified in the model parameters,
         and for each tick, it executes each phase of the model while recording the time taken for each phase.
 
+        Every `params.check_interval` ticks the run controls are evaluated: the `should_stop(model, tick)` method of
+        each component providing one, followed by each callable in `model.controls`. If `params` has no
+        `check_interval`, controls are evaluated every tick; note that `generic.params.get_parameters` defaults it to 7.
+        A control returns a falsy value to continue or a truthy value, ideally a string giving the reason, to stop the
+        run early. When a run stops early, components providing a `truncate(model, nticks)` method are asked to trim
+        their per-tick outputs to the ticks actually run. They should trim the logical length only (e.g., keep a view
+        or `SparseReport.truncate`) so that `reset(model)` can restore the full length without reallocating.
+
         The metrics for each tick are stored in a list. After completing all ticks, it records the finish time and,
         if verbose mode is enabled, prints a summary of the timing metrics.
 
+        Raises:
+
+            ValueError: If `params.check_interval` is less than 1.
+
         Attributes:
 
             tstart (datetime): The start time of the model execution.
             tfinish (datetime): The finish time of the model execution.
             metrics (list): A list of timing metrics for each tick and phase.
+            ticks_run (int): The number of ticks actually run.
+            stop_reason (str): Why the run stopped early, or None if it ran for all `params.nticks` ticks.
 
         Returns:
 
@@ -187,7 +238,14 @@ class Model:
         self.tstart = datetime.now(tz=None)  # noqa: DTZ005
         click.echo(f"{self.tstart}: Running the {self.name} model for {self.params.nticks} ticks…")
 
+        controls = [instance.should_stop for instance in self.instances[1:] if hasattr(instance, "should_stop")] + self.controls
+        interval = self.params.check_interval if "check_interval" in self.params else 1
+        if interval < 1:
+            raise ValueError(f"check_interval must be at least 1, got {interval}")
+
         self.metrics = []
+        self.ticks_run = self.params.nticks
+        self.stop_reason = None
         for tick in tqdm(range(self.params.nticks)):
             timing = [tick]
             for phase in self.phases:
@@ -198,8 +256,23 @@ class Model:
                 timing.append(delta.seconds * 1_000_000 + delta.microseconds)
             self.metrics.append(timing)
 
+            if controls and (tick + 1) % interval == 0:
+                for control in controls:
+                    if decision := control(self, tick):
+                        self.stop_reason = decision if isinstance(decision, str) else getattr(control, "__qualname__", repr(control))
+                        break
+                if self.stop_reason is not None:
+                    self.ticks_run = tick + 1
+                    break
+
         self.tfinish = datetime.now(tz=None)  # noqa: DTZ005
-        print(f"Completed the {self.name} model at {self.tfinish}…")
+        if self.stop_reason is not None:
+            print(f"Stopped the {self.name} model after {self.ticks_run} ticks ({self.stop_reason}) at {self.tfinish}…")
+            for instance in self.instances[1:]:
+                if hasattr(instance, "truncate"):
+                    instance.truncate(self, self.ticks_run)
+        else:
+            print(f"Completed the {self.name} model at {self.tfinish}…")
 
         if self.params.verbose:
             metrics = pd.DataFrame(self.metrics, columns=["tick"] + [type(phase).__name__ for phase in self.phases])
@@ -256,11 +329,13 @@ class Model:
 
             None: This function uses a generator to yield control back to the caller after each plot is created.
 
-        The function generates three plots:
+        The function generates two plots:
+
+            1. An example figure.
+            2. A line chart of the time spent in each update phase on each tick, downsampled to the width of the figure.
 
-            1. A scatter plot of the scenario patches and populations.
-            2. A histogram of the distribution of the day of birth for the initial population.
-            3. A pie chart showing the distribution of update phase times.
+        Long per-tick series should be plotted with `laser_model.plotting.plot_timeseries`, which downsamples them to
+        the width of the figure, as is done here for the per-tick phase times.
         """
 
         _fig = plt.figure(figsize=(12, 9), dpi=128) if fig is None else fig
@@ -269,4 +344,14 @@ class Model:
 
         yield
 
+        _fig = plt.figure(figsize=(12, 9), dpi=128)
+        _fig.suptitle("Update Phase Times")
+        ax = _fig.add_subplot()
+        ax.set_xlabel("Tick")
+        ax.set_ylabel("Time (µs)")
+        metrics = np.array(self.metrics, dtype=np.int64).reshape(len(self.metrics), len(self.phases) + 1)
+        plot_timeseries(ax, metrics[:, 1:], labels=[type(phase).__name__ for phase in self.phases])
+
+        yield
+
         return
@@ -0,0 +1,248 @@
+"""
+This module provides the data layer for `plot()` methods: out-of-core access to recorded outputs, aggregation of
+patches by region, and downsampling of long time series to the width of the figure.
+
+Functions:
+
+    open_report(path) -> array-like:
+        Opens a recorded (nticks, npatches) output, memory-mapped (.npy) or as a `SparseReport` (.npz).
+
+    downsample(data, npoints, chunk=None) -> (np.ndarray, np.ndarray):
+        Reduces each column of a (nticks, ncolumns) output to about `npoints` points, keeping its extremes.
+
+    lttb(x, y, npoints) -> (np.ndarray, np.ndarray):
+        Largest-Triangle-Three-Buckets downsampling of a single series.
+
+    pixel_width(ax) -> int:
+        The width, in pixels, of a matplotlib Axes.
+
+    plot_timeseries(ax, data, regions=None, labels=None, npoints=None):
+        Plots the columns, or regional totals, of a (nticks, npatches) output, downsampled to the width of `ax`.
+
+Classes:
+
+    RegionTotals: A lazy (nticks, nregions) view summing the patches of each region.
+
+All functions read their input in chunks of ticks with ordinary slicing, `data[start:stop]`, so they work equally
+on NumPy arrays, memory-mapped arrays, and `SparseReport`, and never need the whole output resident. Plotting cost
+is proportional to the width of the figure, not the length of the run.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+CHUNK_CELLS = 1 << 22  # cells (ticks x columns) read per chunk
+
+
+def open_report(path):
+    """
+    Open a recorded (nticks, npatches) output without reading it into memory.
+
+    Args:
+
+        path (str or Path): A .npy file (e.g., from `np.save`), which is memory-mapped, or a .npz file written with
+            `SparseReport.save`.
+
+    Returns:
+
+        array-like: A read-only `np.memmap` or a `SparseReport`.
+    """
+
+    path = Path(path)
+    if path.suffix == ".npz":
+        from .reports import SparseReport
+
+        return SparseReport.load(path)
+
+    return np.load(path, mmap_mode="r")
+
+
+class RegionTotals:
+    """
+    A lazy (nticks, nregions) view of a (nticks, npatches) output, summing the patches in each region.
+
+    Args:
+
+        data (array-like): The (nticks, npatches) output.
+        regions (array-like): The region of each patch, e.g., a column of the scenario.
+
+    Attributes:
+
+        labels (np.ndarray): The distinct regions, in column order.
+    """
+
+    def __init__(self, data, regions) -> None:
+        self.data = data
+        self.labels, codes = np.unique(np.asarray(regions), return_inverse=True)
+        self.order = np.argsort(codes, kind="stable")
+        self.starts = np.searchsorted(codes[self.order], np.arange(len(self.labels)))
+        self.shape = (data.shape[0], len(self.labels))
+
+        return
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __getitem__(self, key) -> np.ndarray:
+        chunk = np.asarray(self.data[key])
+        return np.add.reduceat(chunk[..., self.order], self.starts, axis=-1)
+
+
+def downsample(data, npoints: int, chunk: Optional[int] = None):
+    """
+    Reduce each column of `data` to about `npoints` points for plotting, keeping its extremes.
+
+    The ticks are split into `npoints` // 2 buckets and the minimum and the maximum of each column in each bucket are
+    kept, in tick order, so spikes and troughs survive however long the run. The buckets are filled reading `chunk`
+    ticks at a time.
+
+    Args:
+
+        data (array-like): A (nticks,) or (nticks, ncolumns) output supporting `data[start:stop]`.
+        npoints (int): The (approximate) number of points to keep per column, e.g., the width of the plot in pixels.
+        chunk (int, optional): The number of ticks to read at a time. Defaults to about 4M cells' worth.
+
+    Returns:
+
+        (np.ndarray, np.ndarray): The ticks, x, and values, y, of the kept points, each shaped like `data` with
+        fewer rows. `x` differs between columns, which `Axes.plot(x, y)` supports.
+    """
+
+    nticks = data.shape[0]
+    ncolumns = data.shape[1] if len(data.shape) > 1 else 1
+    nbuckets = max(npoints // 2, 1)
+    if nticks <= 2 * nbuckets:
+        y = np.asarray(data[:])
+        x = np.broadcast_to(np.arange(nticks).reshape(-1, *([1] * (y.ndim - 1))), y.shape)
+        return x, y
+
+    if chunk is None:
+        chunk = max(CHUNK_CELLS // ncolumns, 1)
+
+    edges = np.linspace(0, nticks, nbuckets + 1).astype(np.int64)
+    xmin = np.zeros((nbuckets, ncolumns), dtype=np.int64)
+    xmax = np.zeros((nbuckets, ncolumns), dtype=np.int64)
+    ymin = ymax = None
+
+    bucket = 0
+    for start in range(0, nticks, chunk):
+        stop = min(start + chunk, nticks)
+        values = np.asarray(data[start:stop]).reshape(stop - start, ncolumns)
+        if ymin is None:
+            ymin = np.zeros((nbuckets, ncolumns), dtype=values.dtype)
+            ymax = np.zeros((nbuckets, ncolumns), dtype=values.dtype)
+        while bucket < nbuckets and edges[bucket] < stop:
+            lo, hi = max(edges[bucket], start), min(edges[bucket + 1], stop)
+            segment = values[lo - start : hi - start]
+            imin, imax = segment.argmin(axis=0), segment.argmax(axis=0)
+            vmin, vmax = segment[imin, np.arange(ncolumns)], segment[imax, np.arange(ncolumns)]
+            if lo == edges[bucket]:  # first (or only) part of this bucket
+                xmin[bucket], ymin[bucket], xmax[bucket], ymax[bucket] = imin + lo, vmin, imax + lo, vmax
+            else:  # the rest of a bucket split across chunks
+                less, more = vmin < ymin[bucket], vmax > ymax[bucket]
+                xmin[bucket] = np.where(less, imin + lo, xmin[bucket])
+                ymin[bucket] = np.where(less, vmin, ymin[bucket])
+                xmax[bucket] = np.where(more, imax + lo, xmax[bucket])
+                ymax[bucket] = np.where(more, vmax, ymax[bucket])
+            if hi < edges[bucket + 1]:
+                break  # continue this bucket in the next chunk
+            bucket += 1
+
+    # interleave the minimum and maximum of each bucket in tick order
+    first = xmin <= xmax
+    x = np.empty((2 * nbuckets, ncolumns), dtype=np.int64)
+    y = np.empty((2 * nbuckets, ncolumns), dtype=ymin.dtype)
+    x[0::2], x[1::2] = np.where(first, xmin, xmax), np.where(first, xmax, xmin)
+    y[0::2], y[1::2] = np.where(first, ymin, ymax), np.where(first, ymax, ymin)
+
+    if len(data.shape) == 1:
+        x, y = x[:, 0], y[:, 0]
+
+    return x, y
+
+
+def lttb(x, y, npoints: int):
+    """
+    Downsample a single series to `npoints` points with Largest-Triangle-Three-Buckets.
+
+    LTTB keeps the visual shape of a line better than striding, but needs the whole series in memory; apply it to
+    the output of `downsample` (min/max preselection) rather than to a full length output.
+
+    Args:
+
+        x (array-like): The x values, in increasing order.
+        y (array-like): The y values.
+        npoints (int): The number of points to keep, including the first and last.
+
+    Returns:
+
+        (np.ndarray, np.ndarray): The x and y values of the kept points.
+    """
+
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    if npoints >= len(x) or npoints < 3:
+        return x, y
+
+    edges = np.linspace(1, len(x) - 1, npoints - 1).astype(np.int64)
+    keep = np.zeros(npoints, dtype=np.int64)
+    keep[-1] = len(x) - 1
+    previous = 0
+    for index in range(npoints - 2):
+        lo, hi = edges[index], edges[index + 1]
+        # the average of the next bucket (or the last point) is the third vertex of the triangle
+        nlo, nhi = hi, edges[index + 2] if index + 2 < len(edges) else len(x)
+        cx, cy = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        areas = np.abs((x[previous] - cx) * (y[lo:hi] - y[previous]) - (x[previous] - x[lo:hi]) * (cy - y[previous]))
+        previous = lo + int(areas.argmax())
+        keep[index + 1] = previous
+
+    return x[keep], y[keep]
+
+
+def pixel_width(ax) -> int:
+    """
+    Return the width of a matplotlib Axes in display pixels.
+
+    Args:
+
+        ax (Axes): The Axes.
+
+    Returns:
+
+        int: The width in pixels (at least 1).
+    """
+
+    return max(int(ax.get_window_extent().width), 1)
+
+
+def plot_timeseries(ax, data, regions=None, labels=None, npoints: Optional[int] = None):
+    """
+    Plot each column of a (nticks, ncolumns) output, or the totals of each region, downsampled to the width of `ax`.
+
+    Args:
+
+        ax (Axes): The matplotlib Axes to plot on.
+        data (array-like): The (nticks, ncolumns) output, e.g., a NumPy array, `open_report()` result, or `SparseReport`.
+        regions (array-like, optional): The region of each column. If given, the columns of each region are summed.
+        labels (list, optional): Legend labels for the columns. Defaults to the regions, if given.
+        npoints (int, optional): The number of points per line. Defaults to twice the width of `ax` in pixels.
+
+    Returns:
+
+        list: The Line2D objects added to `ax`.
+    """
+
+    if regions is not None:
+        data = RegionTotals(data, regions)
+        labels = list(data.labels) if labels is None else labels
+
+    x, y = downsample(data, 2 * pixel_width(ax) if npoints is None else npoints)
+    lines = ax.plot(x, y)
+    if labels is not None:
+        for line, label in zip(lines, labels):
+            line.set_label(str(label))
+        ax.legend()
+
+    return lines
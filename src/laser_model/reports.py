@@ -0,0 +1,291 @@
+"""
+This module defines the `SparseReport` class, a compact (nticks, npatches) report array.
+
+Classes:
+    SparseReport: A per-tick, per-patch report array stored as sparse blocks of ticks.
+
+Most per-tick, per-patch reports (incidence, importations, deaths, ...) are zero in most cells since most patches have
+no events on most ticks. `SparseReport` keeps one block of ticks, the block currently being written, as a dense array
+so components can update it in place at full speed. Other blocks are stored in coordinate (COO) format: the tick
+within the block, the patch, and the value of each non-zero cell. Reading a slice densifies just the blocks it spans.
+
+Usage:
+
+    A component allocates its report in its constructor and writes the current tick's row as the model runs::
+
+        self.incidence = SparseReport(model.params.nticks, len(model.scenario))
+        ...
+        incidence = self.incidence.row(tick)  # writable, dense view of the current tick
+        incidence[patches] += 1
+
+    Reading it back, e.g., in `plot()`, returns dense NumPy arrays::
+
+        plt.plot(self.incidence[:, 0])
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+
+class SparseReport:
+    """
+    A (nticks, npatches) report array stored as blocks of ticks in sparse, coordinate format.
+
+    Args:
+
+        nticks (int): The number of ticks (rows) in the report.
+        npatches (int): The number of patches (columns) in the report.
+        dtype (np.dtype, optional): The data type of the report values. Defaults to np.int64.
+        block (int, optional): The number of ticks per block. Defaults to 64.
+
+    Notes:
+
+        Writing to a tick outside the current block compresses the current block and decompresses the one being
+        written, so writes should proceed (mostly) in tick order. Reads of any tick range are cheap. Reads return
+        dense copies, not views; see `row()` for in place updates.
+    """
+
+    def __init__(self, nticks: int, npatches: int, dtype=np.int64, block: int = 64) -> None:
+        self.shape = (int(nticks), int(npatches))
+        self.capacity = self.shape[0]  # the number of ticks allocated, restored by reset() after truncate()
+        self.dtype = np.dtype(dtype)
+        self.block = int(block)
+        self._blocks = {}  # block index -> (tick within block, patch, value) arrays
+        self._current = np.zeros((self.block, self.shape[1]), dtype=self.dtype)
+        self._open = 0  # index of the block held, dense, in _current
+
+        return
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    @property
+    def ndim(self) -> int:
+        return 2
+
+    @property
+    def nnz(self) -> int:
+        """The number of non-zero cells in the report."""
+        return sum(len(values) for _, _, values in self._blocks.values()) + int(np.count_nonzero(self._current))
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes used to store the report (the sparse blocks and the dense current block)."""
+        return sum(ticks.nbytes + patches.nbytes + values.nbytes for ticks, patches, values in self._blocks.values()) + self._current.nbytes
+
+    def row(self, tick: int) -> np.ndarray:
+        """
+        Return a writable, dense view of the given tick's row.
+
+        The view is only valid until a tick in a different block is accessed with `row()` or written with `[]`.
+
+        Use `row()`, or `report[tick, patches] += ...`, to update a tick in place. Indexing with `[]` returns a dense
+        copy, so `report[tick][patches] += 1` updates the copy and leaves the report unchanged.
+
+        Args:
+
+            tick (int): The tick.
+
+        Returns:
+
+            np.ndarray: A view of shape (npatches,) into the current block.
+        """
+
+        tick = self._tick(tick)
+        self._select(tick // self.block)
+
+        return self._current[tick % self.block]
+
+    def __getitem__(self, key):
+        ticks, columns = key if isinstance(key, tuple) else (key, slice(None))
+
+        if isinstance(ticks, (int, np.integer)):
+            tick = self._tick(ticks)
+            return self._dense(tick, tick + 1)[0][columns]
+
+        if not isinstance(ticks, slice):
+            raise TypeError(f"SparseReport ticks must be indexed with an integer or a slice, not {type(ticks).__name__}")
+
+        indices = np.arange(*ticks.indices(self.shape[0]))
+        if len(indices) == 0:
+            return np.zeros((0, self.shape[1]), dtype=self.dtype)[:, columns]
+        lo = int(indices.min())
+        dense = self._dense(lo, int(indices.max()) + 1)
+
+        return dense[indices - lo][:, columns] if ticks.step not in (None, 1) else dense[:, columns]
+
+    def __setitem__(self, key, value) -> None:
+        ticks, columns = key if isinstance(key, tuple) else (key, slice(None))
+
+        if isinstance(ticks, (int, np.integer)):
+            self.row(ticks)[columns] = value
+            return
+
+        if not isinstance(ticks, slice):
+            raise TypeError(f"SparseReport ticks must be indexed with an integer or a slice, not {type(ticks).__name__}")
+
+        indices = range(*ticks.indices(self.shape[0]))
+        # broadcast as NumPy would to the selected (ticks, columns), e.g., one value per tick for a single column
+        value = np.broadcast_to(value, (len(indices), *np.empty(self.shape[1], dtype=bool)[columns].shape))
+        for index, tick in enumerate(indices):
+            self.row(tick)[columns] = value[index]
+
+        return
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        dense = self[:]
+        return dense if dtype is None else dense.astype(dtype)
+
+    def truncate(self, nticks: int) -> None:
+        """
+        Drop all ticks at or after `nticks`, e.g., after a run stopped early.
+
+        Only the length of the report changes; `reset()` restores the original length in place.
+
+        Args:
+
+            nticks (int): The new number of ticks.
+
+        Returns:
+
+            None
+        """
+
+        nticks = min(int(nticks), self.shape[0])
+        self._select(-1)  # compress the current block so all blocks can be treated alike
+        for index in list(self._blocks):
+            ticks, patches, values = self._blocks[index]
+            keep = ticks + index * self.block < nticks
+            if not keep.any():
+                del self._blocks[index]
+            elif not keep.all():
+                self._blocks[index] = (ticks[keep], patches[keep], values[keep])
+        self.shape = (nticks, self.shape[1])
+        self._select(0)
+
+        return
+
+    def reset(self) -> None:
+        """
+        Clear the report and restore the length it was created with, e.g., from a component's `reset(model)`.
+
+        Returns:
+
+            None
+        """
+
+        self._blocks.clear()
+        self._current[:] = 0
+        self._open = 0
+        self.shape = (self.capacity, self.shape[1])
+
+        return
+
+    def save(self, path) -> None:
+        """
+        Write the report, compressed, to a NumPy .npz file.
+
+        Args:
+
+            path (str or Path): The file to write.
+
+        Returns:
+
+            None
+        """
+
+        ticks, patches, values = self._coo()
+        np.savez_compressed(path, shape=np.array(self.shape), block=self.block, ticks=ticks, patches=patches, values=values)
+
+        return
+
+    @classmethod
+    def load(cls, path) -> "SparseReport":
+        """
+        Read a report written with `save()`.
+
+        Args:
+
+            path (str or Path): The file to read.
+
+        Returns:
+
+            SparseReport: The report.
+        """
+
+        with np.load(Path(path)) as data:
+            nticks, npatches = (int(n) for n in data["shape"])
+            report = cls(nticks, npatches, dtype=data["values"].dtype, block=int(data["block"]))
+            ticks, patches, values = data["ticks"], data["patches"], data["values"]
+
+        indices = ticks // report.block
+        for index in np.unique(indices):
+            mask = indices == index
+            report._blocks[int(index)] = ((ticks[mask] % report.block).astype(np.int32), patches[mask].astype(np.int32), values[mask])
+        report._open = -1  # block 0 is in _blocks, not yet in _current
+        report._select(0)
+
+        return report
+
+    def _tick(self, tick: int) -> int:
+        tick = int(tick)
+        if tick < 0:
+            tick += self.shape[0]
+        if not 0 <= tick < self.shape[0]:
+            raise IndexError(f"tick {tick} is out of bounds for a report with {self.shape[0]} ticks")
+
+        return tick
+
+    def _select(self, index: int) -> None:
+        # Make block `index` the dense, current block, compressing the previous one. -1 selects no block.
+        if index == self._open:
+            return
+
+        if self._open >= 0:
+            ticks, patches = np.nonzero(self._current)
+            if len(ticks):
+                self._blocks[self._open] = (ticks.astype(np.int32), patches.astype(np.int32), self._current[ticks, patches])
+            else:
+                self._blocks.pop(self._open, None)
+
+        self._current[:] = 0
+        if index in self._blocks:
+            ticks, patches, values = self._blocks.pop(index)
+            self._current[ticks, patches] = values
+        self._open = index
+
+        return
+
+    def _dense(self, lo: int, hi: int) -> np.ndarray:
+        # Densify ticks [lo, hi).
+        dense = np.zeros((hi - lo, self.shape[1]), dtype=self.dtype)
+        for index in range(lo // self.block, (hi - 1) // self.block + 1):
+            base = index * self.block
+            if index == self._open:
+                start, stop = max(lo, base), min(hi, base + self.block)
+                dense[start - lo : stop - lo] = self._current[start - base : stop - base]
+            elif index in self._blocks:
+                ticks, patches, values = self._blocks[index]
+                ticks = ticks + base
+                mask = (ticks >= lo) & (ticks < hi)
+                dense[ticks[mask] - lo, patches[mask]] = values[mask]
+
+        return dense
+
+    def _coo(self):
+        # All non-zero cells, in tick order, as (tick, patch, value) arrays.
+        blocks = dict(self._blocks)
+        ticks, patches = np.nonzero(self._current)
+        if self._open >= 0 and len(ticks):
+            blocks[self._open] = (ticks, patches, self._current[ticks, patches])
+
+        order = sorted(blocks)
+        if not order:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int32), np.zeros(0, dtype=self.dtype)
+
+        ticks = np.concatenate([blocks[index][0].astype(np.int64) + index * self.block for index in order])
+        patches = np.concatenate([blocks[index][1].astype(np.int32) for index in order])
+        values = np.concatenate([blocks[index][2] for index in order])
+
+        return ticks, patches, values
@@ -0,0 +1,100 @@
+import csv
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from laser_model import __version__
+from laser_model.cli import COMMANDS
+from laser_model.cli import laser
+
+
+def test_help_lists_commands():
+    result = CliRunner().invoke(laser, ["--help"])
+    assert result.exit_code == 0
+    for name in COMMANDS:
+        assert name in result.output
+
+
+def test_unknown_command():
+    result = CliRunner().invoke(laser, ["not-a-command"])
+    assert result.exit_code != 0
+
+
+def test_help_does_not_import_model():
+    # `laser --help` should stay fast: none of the heavy dependencies may be imported to dispatch.
+    code = "import sys; from laser_model.cli import laser; laser(['--help'], standalone_mode=False); print(sorted(m for m in ('numpy', 'pandas', 'matplotlib', 'laser_core') if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip().endswith("[]")
+
+
+def test_sweep(tmp_path):
+    output = tmp_path / "sweep.csv"
+    result = CliRunner().invoke(laser, ["sweep", "--grid", "nticks=10,20", "--seeds", "2", "--seed", "7", "--output", str(output)])
+    assert result.exit_code == 0, result.output
+
+    with output.open(newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert [(row["seed"], row["nticks"], row["ticks_run"]) for row in rows] == [
+        ("7", "10", "10"),
+        ("8", "10", "10"),
+        ("7", "20", "20"),
+        ("8", "20", "20"),
+    ]
+    assert all(row["stop_reason"] == "" for row in rows)
+
+
+def test_sweep_rejects_unknown_grid_parameter(tmp_path):
+    output = tmp_path / "sweep.csv"
+    result = CliRunner().invoke(laser, ["sweep", "--grid", "bogus=1,2", "--output", str(output)])
+    assert result.exit_code != 0
+    assert "bogus" in result.output
+    assert not output.exists()
+
+
+@pytest.mark.parametrize(
+    ("grid", "message"),
+    [
+        (["seed=1,2"], "--seeds"),
+        (["nticks=10,20", "nticks=30"], "more than once"),
+        (["nticks=abc"], "nticks"),
+    ],
+)
+def test_sweep_rejects_bad_grid(tmp_path, grid, message):
+    output = tmp_path / "sweep.csv"
+    args = [arg for spec in grid for arg in ("--grid", spec)]
+    result = CliRunner().invoke(laser, ["sweep", *args, "--output", str(output)])
+    assert result.exit_code == 2
+    assert message in result.output
+    assert not output.exists()
+
+
+def test_version():
+    result = CliRunner().invoke(laser, ["--version"])
+    assert result.exit_code == 0
+    assert __version__ in result.output
+
+
+def test_bench():
+    result = CliRunner().invoke(laser, ["bench", "--nticks", "100", "--npatches", "50", "--repeat", "1"])
+    assert result.exit_code == 0, result.output
+    for name in ("model", "sparse-report", "downsample"):
+        assert name in result.output
+    assert "ticks/s" in result.output
+    assert "cells/s" in result.output
+
+
+def test_profile(tmp_path):
+    output = tmp_path / "model.prof"
+    result = CliRunner().invoke(laser, ["profile", "--nticks", "10", "--limit", "5", "--output", str(output)])
+    assert result.exit_code == 0, result.output
+    assert "function calls" in result.output
+    assert output.exists()
+
+
+def test_inspect_scenario():
+    result = CliRunner().invoke(laser, ["inspect-scenario"])
+    assert result.exit_code == 0, result.output
+    assert "3 patches, 1 columns" in result.output
+    assert "node" in result.output
@@ -0,0 +1,79 @@
+import pandas as pd
+import pytest
+from laser_core.propertyset import PropertySet
+
+from laser_model import Model
+
+
+class Component:
+    def __init__(self, model, verbose: bool = False) -> None:
+        self.truncated = None
+
+    def __call__(self, model, tick: int) -> None:
+        return
+
+    def truncate(self, model, nticks: int) -> None:
+        self.truncated = nticks
+
+
+class Outbreak(Component):
+    def should_stop(self, model, tick: int):
+        return "epidemic died out" if tick >= 11 else None
+
+
+def make_model(components, **params):
+    parameters = PropertySet({"nticks": 50, "seed": 20241107, "verbose": False, **params})
+    model = Model(pd.DataFrame({"node": [0, 1, 2]}), parameters)
+    model.components = components
+    return model
+
+
+def test_component_stops_run():
+    model = make_model([Outbreak])
+    model.run()
+
+    assert model.stop_reason == "epidemic died out"
+    assert model.ticks_run == 12
+    assert len(model.metrics) == 12
+    assert model.instances[1].truncated == 12
+
+
+def test_control_stops_run_on_interval():
+    model = make_model([Component], check_interval=5)
+    model.controls.append(lambda model, tick: "too many" if tick >= 11 else None)
+    model.run()
+
+    assert model.stop_reason == "too many"
+    assert model.ticks_run == 15  # the first check at or after tick 11 is after tick 14
+    assert len(model.metrics) == 15
+    assert model.instances[1].truncated == 15
+
+
+def stop_now(model, tick):
+    return True
+
+
+def test_truthy_control_reason_is_qualname():
+    model = make_model([Component])
+    model.controls.append(stop_now)
+    model.run()
+
+    assert model.stop_reason == "stop_now"
+    assert model.ticks_run == 1
+
+
+def test_run_to_completion():
+    model = make_model([Component])
+    model.controls.append(lambda model, tick: None)
+    model.run()
+
+    assert model.stop_reason is None
+    assert model.ticks_run == 50
+    assert len(model.metrics) == 50
+    assert model.instances[1].truncated is None
+
+
+def test_check_interval_must_be_positive():
+    model = make_model([Outbreak], check_interval=0)
+    with pytest.raises(ValueError, match="check_interval"):
+        model.run()
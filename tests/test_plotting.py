@@ -0,0 +1,55 @@
+import numpy as np
+
+from laser_model.plotting import RegionTotals
+from laser_model.plotting import downsample
+from laser_model.plotting import lttb
+from laser_model.plotting import open_report
+
+
+def test_downsample_keeps_extremes():
+    prng = np.random.default_rng(20241107)
+    data = prng.normal(size=(10_000, 3))
+    x, y = downsample(data, 200, chunk=333)  # chunks which do not align with the buckets
+
+    assert x.shape == y.shape == (200, 3)
+    assert np.array_equal(y.max(axis=0), data.max(axis=0))
+    assert np.array_equal(y.min(axis=0), data.min(axis=0))
+    assert (np.diff(x, axis=0) > 0).all()
+    assert np.array_equal(y, data[x, np.arange(3)])
+
+
+def test_downsample_short_series():
+    data = np.arange(50)
+    x, y = downsample(data, 200)
+
+    assert np.array_equal(x, data)
+    assert np.array_equal(y, data)
+
+
+def test_region_totals():
+    data = np.arange(24).reshape(4, 6)
+    totals = RegionTotals(data, ["b", "a", "b", "c", "a", "a"])
+
+    assert totals.shape == (4, 3)
+    assert list(totals.labels) == ["a", "b", "c"]
+    assert np.array_equal(totals[1:3], np.stack([data[1:3, [1, 4, 5]].sum(axis=1), data[1:3, [0, 2]].sum(axis=1), data[1:3, 3]], axis=1))
+
+
+def test_lttb():
+    x = np.arange(1000)
+    y = np.sin(x / 50)
+    xs, ys = lttb(x, y, 100)
+
+    assert len(xs) == len(ys) == 100
+    assert xs[0] == 0
+    assert xs[-1] == 999
+    assert (np.diff(xs) > 0).all()
+
+
+def test_open_report_memmap(tmp_path):
+    data = np.arange(60).reshape(20, 3)
+    np.save(tmp_path / "report.npy", data)
+    report = open_report(tmp_path / "report.npy")
+
+    assert isinstance(report, np.memmap)
+    assert np.array_equal(report[5:10], data[5:10])
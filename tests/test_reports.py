@@ -0,0 +1,93 @@
+import numpy as np
+
+from laser_model import SparseReport
+
+
+def test_sparse_report_matches_dense():
+    nticks, npatches = 200, 17
+    prng = np.random.default_rng(20241107)
+    dense = np.zeros((nticks, npatches), dtype=np.int64)
+    report = SparseReport(nticks, npatches, block=16)
+    for tick in range(nticks):
+        patches = prng.choice(npatches, size=2, replace=False)
+        dense[tick, patches] += tick
+        report.row(tick)[patches] += tick
+
+    assert report.nnz == np.count_nonzero(dense)
+    assert np.array_equal(report[:], dense)
+    assert np.array_equal(report[37:150], dense[37:150])
+    assert np.array_equal(report[::-3, 4], dense[::-3, 4])
+    assert np.array_equal(report[-1], dense[-1])
+    assert np.array_equal(np.asarray(report), dense)
+
+
+def test_sparse_report_setitem():
+    report = SparseReport(10, 3, block=4)
+    report[2] = [1, 0, 2]
+    report[5:8, 1] = 7
+    report[1, 2] = 3
+    report[2, 0] += 1
+
+    expected = np.zeros((10, 3), dtype=np.int64)
+    expected[2] = [2, 0, 2]
+    expected[5:8, 1] = 7
+    expected[1, 2] = 3
+    assert np.array_equal(report[:], expected)
+
+
+def test_sparse_report_truncate():
+    report = SparseReport(100, 4, block=8)
+    for tick in range(100):
+        report[tick, tick % 4] = tick + 1
+    expected = report[:45]
+    report.truncate(45)
+
+    assert report.shape == (45, 4)
+    assert np.array_equal(report[:], expected)
+    assert report.nnz == 45
+
+
+def test_sparse_report_save_load(tmp_path):
+    report = SparseReport(50, 5, dtype=np.int32, block=8)
+    for tick in range(0, 50, 3):
+        report[tick, tick % 5] = tick
+    report.save(tmp_path / "report.npz")
+    loaded = SparseReport.load(tmp_path / "report.npz")
+
+    assert loaded.shape == report.shape
+    assert loaded.dtype == np.int32
+    assert np.array_equal(loaded[:], report[:])
+
+
+def test_sparse_report_reset_after_truncate():
+    report = SparseReport(100, 4, block=8)
+    for tick in range(30):
+        report[tick, 1] = 1
+    report.truncate(30)
+    report.reset()
+
+    assert report.shape == (100, 4)
+    assert report.nnz == 0
+    report[99, 3] = 5
+    assert report[99, 3] == 5
+
+
+def test_sparse_report_setitem_broadcasts():
+    report = SparseReport(6, 4, block=4)
+    report[0:3, 1] = np.array([1, 2, 3])
+    report[3:6, 2:4] = [[1, 2], [3, 4], [5, 6]]
+    report[::2] = 9
+
+    expected = np.zeros((6, 4), dtype=np.int64)
+    expected[0:3, 1] = [1, 2, 3]
+    expected[3:6, 2:4] = [[1, 2], [3, 4], [5, 6]]
+    expected[::2] = 9
+    assert np.array_equal(report[:], expected)
+
+
+def test_sparse_report_getitem_is_a_copy():
+    report = SparseReport(4, 3)
+    report[1][2] += 1
+    assert report.nnz == 0
+    report.row(1)[2] += 1
+    assert report[1, 2] == 1
@@ -0,0 +1,116 @@
+import io
+import json
+
+import pytest
+
+from laser_model.generic import server
+from laser_model.generic.server import INVALID_PARAMS
+from laser_model.generic.server import METHOD_NOT_FOUND
+from laser_model.generic.server import PARSE_ERROR
+from laser_model.generic.server import Worker
+
+
+class Component:
+    def __init__(self, model, verbose: bool = False) -> None:
+        self.resets = 0
+
+    def __call__(self, model, tick: int) -> None:
+        return
+
+    def reset(self, model) -> None:
+        self.resets += 1
+
+    def results(self, model) -> dict:
+        return {"resets": self.resets}
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    monkeypatch.setattr(server, "get_components", lambda: [Component])
+    return Worker({"nticks": 10, "seed": 20241107})
+
+
+def test_runs_reuse_model(worker):
+    model = worker.model
+    component = model.instances[1]
+    first = worker.run(seed=1)
+    second = worker.run(seed=2)
+
+    assert worker.model is model
+    assert model.instances[1] is component
+    assert (first["seed"], second["seed"]) == (1, 2)
+    assert (first["results"]["resets"], second["results"]["resets"]) == (1, 2)
+    assert second["ticks_run"] == 10
+
+
+def test_nticks_change_recreates_components(worker):
+    worker.run()
+    component = worker.model.instances[1]
+    result = worker.run(nticks=20)
+
+    assert worker.model.instances[1] is not component
+    assert result["nticks"] == result["ticks_run"] == 20
+
+
+def test_param_overrides(worker):
+    result = worker.run(param=["nticks=5"])
+    assert result["ticks_run"] == 5
+
+
+def error_code(response):
+    return response["error"]["code"]
+
+
+def test_handle_errors(worker):
+    assert error_code(worker.handle("{not json")) == PARSE_ERROR
+    assert error_code(worker.handle('{"jsonrpc": "2.0", "id": 1, "method": "fly"}')) == METHOD_NOT_FOUND
+    assert error_code(worker.handle('{"jsonrpc": "2.0", "id": 1, "method": "run", "params": [1, 2]}')) == INVALID_PARAMS
+    assert error_code(worker.handle('{"jsonrpc": "2.0", "id": 1, "method": "run", "params": {"param": "nticks=30"}}')) == INVALID_PARAMS
+    assert error_code(worker.handle('{"jsonrpc": "2.0", "id": 1, "method": "run", "params": {"nticks": "10"}}')) == INVALID_PARAMS
+    assert error_code(worker.handle('{"jsonrpc": "2.0", "id": 1, "method": "run", "params": {"seed": 1.5}}')) == INVALID_PARAMS
+    assert error_code(worker.handle('{"jsonrpc": "2.0", "id": 1, "method": "run", "params": {"nticks": -5}}')) == INVALID_PARAMS
+    assert error_code(worker.handle('{"jsonrpc": "2.0", "id": 1, "method": "run", "params": {"nticks": 0}}')) == INVALID_PARAMS
+    assert error_code(worker.handle(b"\xff\xfe")) == PARSE_ERROR
+
+
+def test_notification_has_no_response(worker):
+    assert worker.handle('{"jsonrpc": "2.0", "method": "ping"}') is None
+    assert worker.handle('{"jsonrpc": "2.0", "method": "fly"}') is None
+    assert worker.handle('{"jsonrpc": "2.0", "method": "run", "params": {"nticks": "10"}}') is None
+    assert worker.handle('{"jsonrpc": "2.0", "id": 7, "method": "ping"}') == {"jsonrpc": "2.0", "id": 7, "result": "pong"}
+
+
+def test_serve_until_shutdown(worker):
+    requests = [
+        {"jsonrpc": "2.0", "id": 1, "method": "run", "params": {"seed": 42}},
+        {"jsonrpc": "2.0", "id": 2, "method": "shutdown"},
+        {"jsonrpc": "2.0", "id": 3, "method": "ping"},
+    ]
+    lines = [json.dumps(request).encode("utf-8") + b"\n" for request in requests]
+    rfile = io.BytesIO(b"\xff\xfe\n" + b"".join(lines))  # a line which is not UTF-8 must not stop the worker
+    wfile = io.BytesIO()
+    worker.serve(rfile, wfile)
+    responses = [json.loads(line) for line in wfile.getvalue().splitlines()]
+
+    assert worker.stopped
+    assert error_code(responses[0]) == PARSE_ERROR
+    assert [response["id"] for response in responses] == [None, 1, 2]
+    assert responses[1]["result"]["seed"] == 42
+
+
+class Stopper(Component):
+    def should_stop(self, model, tick: int):
+        return "stop" if tick >= 2 else None
+
+
+def test_early_stop_keeps_components(monkeypatch):
+    monkeypatch.setattr(server, "get_components", lambda: [Stopper])
+    worker = Worker({"nticks": 10, "seed": 20241107, "param": ("check_interval=1",)})
+    component = worker.model.instances[1]
+    first = worker.run()
+    second = worker.run()
+
+    assert (first["stop_reason"], first["ticks_run"]) == ("stop", 3)
+    assert (second["stop_reason"], second["ticks_run"]) == ("stop", 3)
+    assert worker.model.instances[1] is component
+    assert second["results"]["resets"] == 2